@@ -1,4 +1,7 @@
 import re
+from difflib import get_close_matches
+from functools import lru_cache
+from typing import Optional
 
 men = {
     "England": 1,
@@ -48,7 +51,110 @@ women = {
     "Trinidad & Tobago": 3843,
 }
 
+# Lowercase name -> team number, for case-insensitive country lookups
+men_lower = {name.lower(): team for name, team in men.items()}
+women_lower = {name.lower(): team for name, team in women.items()}
+men_lower_names = tuple(men_lower)
+women_lower_names = tuple(women_lower)
 
+
+def team_number(country: str, sex: str) -> Optional[int]:
+    """
+    Looks up the Statsguru team number for a country name.
+
+    Args:
+        country (str): The country name, matched case-insensitively and fuzzily.
+        sex (str): "men" or "women".
+
+    Returns:
+        Optional[int]: The team number, or None if no country is close enough.
+    """
+    return _team_number(sex, country.lower())
+
+
+# Memoised so repeat lookups of the same name skip the fuzzy match
+@lru_cache(maxsize=256)
+def _team_number(sex: str, country: str) -> Optional[int]:
+    if sex == "men":
+        country_lower, country_names = men_lower, men_lower_names
+    else:
+        country_lower, country_names = women_lower, women_lower_names
+    # Exact match first, closest match otherwise
+    team = country_lower.get(country)
+    if team is None:
+        country_match = get_close_matches(country, country_names, n=1, cutoff=0.5)
+        if country_match:
+            team = country_lower[country_match[0]]
+    return team
+
+
+# Country patterns and their replacements
+patterns = [
+    (r"AFG", "Afghanistan"),
+    (r"Afr$", "Africa XI"),
+    (r"AUS", "Australia"),
+    (r"Bdesh|BDESH|BD", "Bangladesh"),
+    (r"BMUDA", "Bermuda"),
+    (r"CAN", "Canada"),
+    (r"DnWmn|Denmk", "Denmark"),
+    (r"EAf", "East (and Central) Africa"),
+    (r"ENG", "England"),
+    (r"HKG", "Hong Kong"),
+    (r"ICC$", "ICC World XI"),
+    (r"INDIA|IND", "India"),
+    (r"IntWn|Int XI", "International XI"),
+    (r"Ire$|IRELAND|IRE", "Ireland"),
+    (r"JamWn", "Jamaica"),
+    (r"JPN", "Japan"),
+    (r"KENYA", "Kenya"),
+    (r"NAM", "Namibia"),
+    (r"NEPAL", "Nepal"),
+    (r"Neth$|NL", "Netherlands"),
+    (r"NZ", "New Zealand"),
+    (r"OMAN", "Oman"),
+    (r"PAK", "Pakistan"),
+    (r"PNG|P\.N\.G\.", "Papua New Guinea"),
+    (r"^SA", "South Africa"),
+    (r"SCOT|SCO|Scot$", "Scotland"),
+    (r"SL", "Sri Lanka"),
+    (r"TTWmn|T & T", "Trinidad and Tobago"),
+    (r"UAE|U\.A\.E\.", "United Arab Emirates"),
+    (r"USA|U\.S\.A\.", "United States of America"),
+    (r"World$|World-XI", "World XI"),
+    (r"WI", "West Indies"),
+    (r"YEWmn|Y\. Eng", "Young England"),
+    (r"ZIM", "Zimbabwe"),
+]
+
+# Fuse every pattern into one named-group alternation so each call is a single scan
+_REPLACEMENTS = {f"g{i}": replacement for i, (_, replacement) in enumerate(patterns)}
+_PATTERN = re.compile(
+    "|".join(f"(?P<g{i}>{pattern})" for i, (pattern, _) in enumerate(patterns))
+)
+
+
+def _sub_patterns(country: str) -> str:
+    return _PATTERN.sub(lambda m: _REPLACEMENTS[m.lastgroup], country)
+
+
+# Exact lookups for canonical names and bare abbreviations, resolved through the
+# regex pipeline once so the fast path always agrees with it
+_EXACT = {
+    name: _sub_patterns(name)
+    for name in [
+        *men,
+        *women,
+        *(
+            alternative.strip("^$").replace("\\", "")
+            for pattern, _ in patterns
+            for alternative in pattern.split("|")
+        ),
+    ]
+}
+
+
+# Memoised so Series.map(rename_country) only scans each distinct name once
+@lru_cache(maxsize=1024)
 def rename_country(country: str) -> str:
     """
     Standardizes and replaces country abbreviations or shorthand with their full names.
@@ -59,46 +165,10 @@ def rename_country(country: str) -> str:
     Returns:
         str: The standardized country name (e.g., "Afghanistan", "Australia", "England").
     """
-    # Define a series of patterns and their replacements
-    patterns = [
-        (r"AFG", "Afghanistan"),
-        (r"Afr$", "Africa XI"),
-        (r"AUS", "Australia"),
-        (r"Bdesh|BDESH|BD", "Bangladesh"),
-        (r"BMUDA", "Bermuda"),
-        (r"CAN", "Canada"),
-        (r"DnWmn|Denmk", "Denmark"),
-        (r"EAf", "East (and Central) Africa"),
-        (r"ENG", "England"),
-        (r"HKG", "Hong Kong"),
-        (r"ICC$", "ICC World XI"),
-        (r"INDIA|IND", "India"),
-        (r"IntWn|Int XI", "International XI"),
-        (r"Ire$|IRELAND|IRE", "Ireland"),
-        (r"JamWn", "Jamaica"),
-        (r"JPN", "Japan"),
-        (r"KENYA", "Kenya"),
-        (r"NAM", "Namibia"),
-        (r"NEPAL", "Nepal"),
-        (r"Neth$|NL", "Netherlands"),
-        (r"NZ", "New Zealand"),
-        (r"OMAN", "Oman"),
-        (r"PAK", "Pakistan"),
-        (r"PNG|P\.N\.G\.", "Papua New Guinea"),
-        (r"^SA", "South Africa"),
-        (r"SCOT|SCO|Scot$", "Scotland"),
-        (r"SL", "Sri Lanka"),
-        (r"TTWmn|T & T", "Trinidad and Tobago"),
-        (r"UAE|U\.A\.E\.", "United Arab Emirates"),
-        (r"USA|U\.S\.A\.", "United States of America"),
-        (r"World$|World-XI", "World XI"),
-        (r"WI", "West Indies"),
-        (r"YEWmn|Y\. Eng", "Young England"),
-        (r"ZIM", "Zimbabwe"),
-    ]
-
-    # Search through each pattern and replacement
-    for pattern, replacement in patterns:
-        country = re.sub(pattern, replacement, country)
+    # Known names and abbreviations skip the regex scan entirely
+    hit = _EXACT.get(country)
+    if hit is not None:
+        return hit
 
-    return country
+    # Replace each matched abbreviation with its full name in one pass
+    return _sub_patterns(country)
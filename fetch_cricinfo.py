@@ -3,18 +3,140 @@ import requests
 import pandas as pd
 import numpy as np
 import os
+import re
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from dotenv import load_dotenv
 from countries import *
-from difflib import get_close_matches
-from io import StringIO
+from io import BytesIO
 from typing import Tuple, Literal, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from helpers import private_cache_dir
+
+# Optional on-disk HTTP cache for repeat calls
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
 
 # Set environment
 env_path = Path(__file__).parent / ".env"
 load_dotenv(env_path)
 env = os.getenv("env")
 
+# Number of pages requested ahead of the one being parsed
+PREFETCH_PAGES = 8
+
+# Seconds a cached Statsguru page is reused when requests_cache is installed
+CACHE_EXPIRE_AFTER = 86400
+
+# Statsguru's "Page 1 of N" pagination text
+PAGE_COUNT_PATTERN = re.compile(rb"Page\s+\d+\s+of\s+(\d+)")
+
+# Statsguru's message on a results page past the last record
+NO_RECORDS_TEXT = b"No records available to match this query"
+
+
+# %%
+# Created on first use and kept for the life of the process so connections
+# survive across calls, without touching the disk or network at import
+@lru_cache(maxsize=None)
+def _get_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all Statsguru requests.
+
+    The session serves repeat requests from disk when `requests_cache` is
+    installed and the user's private cache directory is available, keeps one
+    pooled connection per concurrent page request, and retries transient
+    server errors with backoff.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    # Serve repeat requests from disk when requests_cache is available - only
+    # from a private directory, as cached responses are unpickled
+    cache_dir = private_cache_dir() if CachedSession is not None else None
+    if cache_dir is not None:
+        session = CachedSession(
+            os.path.join(cache_dir, "cricinfo_cache"),
+            backend="sqlite",
+            expire_after=CACHE_EXPIRE_AFTER,
+        )
+    else:
+        session = requests.Session()
+
+    # Header to prevent Error 403 permission denied
+    session.headers.update(
+        {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"
+        }
+    )
+
+    # One pooled connection per concurrent page request, retrying transient
+    # errors - the last error response is returned rather than raised, so
+    # _fetch_page still reports it as an HTTPError
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=PREFETCH_PAGES,
+            pool_maxsize=PREFETCH_PAGES,
+            max_retries=retries,
+        ),
+    )
+    return session
+
+
+# %%
+def _fetch_page(
+    session: requests.Session, url: str
+) -> Tuple[requests.Response, Optional[pd.DataFrame]]:
+    """
+    Fetch one Statsguru results page and parse its data table.
+
+    Args:
+        session (requests.Session): The session to send the request through.
+        url (str): The URL of the results page.
+
+    Returns:
+        Tuple[requests.Response, Optional[pd.DataFrame]]: The response and the
+            data table parsed from it, or None if the page has no records.
+
+    Raises:
+        HTTPError: If an HTTP error occurs while fetching the page.
+        RuntimeError: If the HTML structure of the page is unexpected or parsing fails.
+    """
+    # Send request and check errors
+    page = session.get(url)
+
+    if not page.ok:
+        raise requests.exceptions.HTTPError(
+            f"HTTP Error {page.status_code}: Unable to fetch data from {url}"
+        )
+
+    # Skip parsing pages with no records
+    if NO_RECORDS_TEXT in page.content:
+        return page, None
+
+    # Read table from the raw HTML bytes - safely
+    try:
+        tables = pd.read_html(BytesIO(page.content))
+        if len(tables) < 3:
+            raise RuntimeError("Unexpected HTML structure: Data table not found")
+        data = tables[2]
+    except ValueError:
+        raise RuntimeError("Failed to parse HTML")
+
+    return page, data
+
 
 # %%
 def fetch_cricinfo(
@@ -80,7 +202,11 @@ def fetch_cricinfo(
     Notes:
         - The function relies on ESPNcricinfo's stats page and may break if
           the page structure changes.
-        - Pagination is handled automatically, with a maximum limit of 100 pages.
+        - Pagination is handled automatically, with a maximum limit of 100 pages
+          or the page count reported by Statsguru, whichever is smaller.
+          Up to `PREFETCH_PAGES` pages are fetched and parsed concurrently.
+        - If `requests_cache` is installed, pages are cached on disk in the
+          user's private cache directory for `CACHE_EXPIRE_AFTER` seconds.
         - The `country` argument uses fuzzy matching to identify the best match
           for the provided country name.
     """
@@ -115,18 +241,11 @@ def fetch_cricinfo(
 
     # Team number matching for input country
     if country is not None:
-        country_sex = men if sex == "men" else women
-        # Get closest country match
-        country_match = get_close_matches(
-            country.lower(), map(str.lower, country_sex.keys()), n=1, cutoff=0.5
-        )
-        if (
-            len(country_match) == 0
-            or country_match[0].title() not in country_sex.keys()
-        ):
+        # Get team code - exact match first, closest match otherwise
+        team = team_number(country, sex)
+        if team is None:
             raise ValueError("Country not found")
-        # Get team code and team URL segment
-        team = country_sex[country_match[0].title()]
+        # Get team URL segment
         team_text = f";team={team}"
     else:
         team_text = ""
@@ -134,56 +253,64 @@ def fetch_cricinfo(
     # Define base URL
     base_url = "https://stats.espncricinfo.com/ci/engine/stats/index.html"
 
-    # Header to prevent Error 403 permission denied
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"
-    }
+    # Modify URL based on type of info selected - only the page number varies
+    url_prefix = f"{base_url}?class={matchclass}{team_text};page="
+    url_suffix = f";template=results;type={activity}{view_text};wrappertype=print"
 
-    # Init while loop setting - storage, page num etc.
-    table_store = {}
+    # Init pagination settings - storage, page num etc.
+    table_store = []
     page_num = 1
-    theend = False
-
-    # Pagination
-    while not theend and page_num <= max_pages:
-
-        # Modify URL based on type of info selected
-        url = f"{base_url}?class={matchclass}{team_text};page={page_num};template=results;type={activity}{view_text};wrappertype=print"
-
-        # Send request and check errors
-        page = requests.get(url, headers=headers)
-
-        if not page.ok:
-            raise requests.exceptions.HTTPError(
-                f"HTTP Error {page.status_code}: Unable to fetch data from {url}"
-            )
-
-        # Read table from HTML - safely
-        try:
-            tables = pd.read_html(StringIO(page.text))
-            if len(tables) < 3:
-                raise RuntimeError("Unexpected HTML structure: Data table not found")
-            data = tables[2]
-        except ValueError:
-            raise RuntimeError("Failed to parse HTML")
-
-        # # Make everything string for now
-        # data = data.astype(str)
-
-        # Check if extract data is empty and break if so
-        if data.shape == (1, 1):
-            if page == 1:
-                raise RuntimeError(
-                    f"No data available for {activity} in {matchtype} matches"
-                )
-            break
-
-        # Append data
-        table_store[page_num] = data
-        page_num += 1
+    next_page = 1
+    pending = deque()
+    session = _get_session()
+
+    # Pagination - fetch and parse the next few pages in the background,
+    # reusing connections through the shared session
+    executor = ThreadPoolExecutor(max_workers=PREFETCH_PAGES)
+    try:
+
+        def prefetch(depth):
+            nonlocal next_page
+            while next_page <= max_pages and len(pending) < depth:
+                url = url_prefix + str(next_page) + url_suffix
+                pending.append(executor.submit(_fetch_page, session, url))
+                next_page += 1
+
+        # Fetch the first page alone to learn the page count
+        prefetch(1)
+        while pending:
+
+            # Wait for the page and its parsed table
+            page, data = pending.popleft().result()
+
+            # Stop at the page count reported on the first page
+            if page_num == 1:
+                page_count = PAGE_COUNT_PATTERN.search(page.content)
+                if page_count is not None:
+                    max_pages = min(max_pages, int(page_count.group(1)))
+
+            # Check if extract data is empty and break if so
+            if data is None or data.shape == (1, 1):
+                if page_num == 1:
+                    raise RuntimeError(
+                        f"No data available for {activity} in {matchtype} matches"
+                    )
+                break
+
+            # Append data and queue up the next page
+            table_store.append(data)
+            page_num += 1
+            prefetch(PREFETCH_PAGES)
+
+    finally:
+        # Don't wait for requests still in flight past the last page, or after
+        # an error - they finish in the background and their results are dropped
+        executor.shutdown(wait=False, cancel_futures=True)
 
     # Concat
-    scraped = pd.concat(table_store).reset_index(drop=True)
+    if not table_store:
+        return pd.DataFrame()
+    scraped = pd.concat(table_store, ignore_index=True)
 
     return scraped
 
@@ -3,37 +3,116 @@ import requests
 import pandas as pd
 import numpy as np
 import os
+import importlib.util
 import tempfile
+import threading
 import zipfile
 from pathlib import Path
+from io import BytesIO
 from countries import *
-from typing import List
+from typing import Any, Callable, IO, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from helpers import *
 
-pd.set_option("display.max_columns", 100)
+# Use pyarrow's multithreaded CSV parser for ball-by-ball files when installed
+BBB_CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") is not None else "c"
+
+# Threads used to read match files - the CSV parser releases the GIL
+READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Bytes written to disk per chunk when downloading a zip
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Parallel byte-range requests used to download the rest of a zip
+DOWNLOAD_PARTS = 8
+
+# Seconds to wait for Cricsheet to accept a connection and between bytes
+# received, so an unresponsive server falls back to any cached copy
+DOWNLOAD_TIMEOUT = (10, 60)
+
+# Bump when the data read from a zip changes shape, so older caches are ignored
+CACHE_VERSION = 2
+
+# Shared session so repeat downloads reuse the connection to cricsheet.org
+SESSION = requests.Session()
+SESSION.headers.update(
+    {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"
+    }
+)
+
+
+# %%
+def read_zip_members(
+    zip_path: str, names: List[str], read: Callable[[IO[bytes], str], Any]
+) -> List[Any]:
+    """Reads members of a zip file in parallel without extracting them.
+
+    Each worker thread opens its own handle on the zip, as a single `ZipFile`
+    must not be read from several threads at once.
+
+    Args:
+        zip_path (str): Path to the zip file.
+        names (List[str]): Names of the members to read.
+        read (Callable[[IO[bytes], str], Any]): Function taking an open member
+            and its name and returning its contents, e.g. a DataFrame.
+
+    Returns:
+        List[Any]: The values returned by `read`, in the order of `names`.
+    """
+    local = threading.local()
+    handles = []
+
+    def read_member(name):
+        if not hasattr(local, "zip"):
+            local.zip = zipfile.ZipFile(zip_path, "r")
+            handles.append(local.zip)
+        with local.zip.open(name) as f:
+            return read(f, name)
+
+    try:
+        with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+            return list(executor.map(read_member, names))
+    finally:
+        for handle in handles:
+            handle.close()
 
 
 # %%
-def process_bbb_data(match_filepaths: List[str]) -> pd.DataFrame:
-    """Processes ball-by-ball data from given CSV file paths.
+def process_bbb_data(zip_path: str, match_files: List[str]) -> pd.DataFrame:
+    """Processes ball-by-ball data from CSV files in a zip.
 
-    This function reads a list of CSV file paths containing ball-by-ball data,
-    concatenates them into a single DataFrame, and processes the match IDs
-    by extracting relevant parts and removing file extensions.
+    This function reads a list of CSV files containing ball-by-ball data straight
+    from the zip and combines them into a single DataFrame. Files sharing a
+    header are joined and parsed in one `read_csv` call, and each row keeps the
+    match ID from the file's own `match_id` column.
 
     Args:
-        match_filepaths (List[str]): A list of file paths pointing to CSV files
-            with ball-by-ball data.
+        zip_path (str): Path to the zip file containing the CSV files.
+        match_files (List[str]): Names of the CSV files with ball-by-ball data.
 
     Returns:
         pd.DataFrame: A DataFrame containing the combined and processed ball-by-ball data.
     """
-    dataframes = [pd.read_csv(f).assign(match_id=f) for f in match_filepaths]
+    # all_matches.csv already combines every match - parse it as it streams
+    if match_files == ["all_matches.csv"]:
+        with zipfile.ZipFile(zip_path, "r") as z, z.open(match_files[0]) as f:
+            return pd.read_csv(f, engine=BBB_CSV_ENGINE)
+
+    # Group file bodies by header, keeping a single copy of each header
+    contents = read_zip_members(zip_path, match_files, lambda f, name: f.read())
+    groups = {}
+    for content in contents:
+        header, _, rows = content.partition(b"\n")
+        if rows and not rows.endswith(b"\n"):
+            rows += b"\n"
+        groups.setdefault(header, [header + b"\n"]).append(rows)
+
+    dataframes = [
+        pd.read_csv(BytesIO(b"".join(parts)), engine=BBB_CSV_ENGINE)
+        for parts in groups.values()
+    ]
     all_matches = pd.concat(dataframes, ignore_index=True)
-    all_matches["match_id"] = all_matches["match_id"].str.extract(
-        r"([a-zA-Z0-9_\-\.]*$)"
-    )
-    all_matches["match_id"] = all_matches["match_id"].str.replace(".csv", "")
     return all_matches
 
 
@@ -52,36 +131,32 @@ def process_match_metadata(all_matches: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: A wide-format DataFrame with organized metadata for each match.
     """
-    # Process metadata
-    all_matches = all_matches[~all_matches.key.isin(["player", "players", "registry"])]
-
-    # Process team number
-    all_matches["team"] = all_matches["key"] == "team"
-    all_matches["team"] = all_matches.groupby("match_id")["team"].cumsum()
-    all_matches["key"] = np.where(
-        all_matches["key"] == "team",
-        all_matches["key"] + all_matches["team"].astype(str),
-        all_matches["key"],
-    )
-    # Process umpire number
-    all_matches["umpire"] = all_matches["key"] == "umpire"
-    all_matches["umpire"] = all_matches.groupby("match_id")["umpire"].cumsum()
-    all_matches["key"] = np.where(
-        all_matches["key"] == "umpire",
-        all_matches["key"] + all_matches["umpire"].astype(str),
-        all_matches["key"],
-    )
-    # Keep 2 umpires
-    all_matches = all_matches.query("key != 'umpire3'")
+    # Number teams and umpires within each match, e.g. team -> team1, team2
+    key = all_matches["key"].to_numpy(dtype=object, copy=True)
+    match_ids = all_matches["match_id"].to_numpy()
+    keep = ~np.isin(key, ["player", "players", "registry"])
+    for role in ["team", "umpire"]:
+        is_role = key == role
+        role_num = pd.Series(is_role).groupby(match_ids, sort=False).cumsum()
+        role_num = role_num.to_numpy()
+        key[is_role] = np.char.add(role, role_num[is_role].astype(str))
+        # Keep 2 umpires
+        if role == "umpire":
+            keep &= ~(is_role & (role_num > 2))
+
+    # Drop player rows and extra umpires in one pass
+    all_matches = all_matches[keep].assign(key=key[keep])
 
     # Deduplicate dates and keep first
     # Residual duplication include match date, TV and reserve umpires, and player of match
     all_matches = all_matches.drop_duplicates(["match_id", "key"], keep="first")
 
-    # Finally create pivot table
-    all_matches = all_matches.pivot(
-        index="match_id", columns="key", values="value"
-    ).reset_index()
+    # Finally create pivot table from the deduplicated keys
+    all_matches = (
+        all_matches.set_index(["match_id", "key"])["value"]
+        .unstack("key")
+        .reset_index()
+    )
 
     # Reorder columns
     cols_order = [
@@ -100,38 +175,38 @@ def process_match_metadata(all_matches: pd.DataFrame) -> pd.DataFrame:
         "toss_decision",
         "player_of_match",
     ]
-    cols_order += [col for col in all_matches.columns if col not in cols_order]
-    all_matches = all_matches[cols_order]
+    known = set(cols_order)
+    cols_order += [col for col in all_matches.columns if col not in known]
+    all_matches = all_matches.reindex(columns=cols_order)
     return all_matches
 
 
 # %%
-def process_metadata(match_filepaths: List[str]) -> pd.DataFrame:
-    """Processes metadata or player data from given file paths.
+def process_metadata(zip_path: str, match_files: List[str], type: str) -> pd.DataFrame:
+    """Processes metadata or player data from CSV files in a zip.
 
-    This function reads a list of CSV file paths containing match or player metadata,
-    processes the data based on the specified type, and returns a structured DataFrame.
+    This function reads a list of CSV files containing match or player metadata
+    straight from the zip, processes the data based on the specified type, and
+    returns a structured DataFrame.
 
     Args:
-        match_filepaths (List[str]): A list of file paths pointing to CSV files
-            with metadata or player data.
+        zip_path (str): Path to the zip file containing the CSV files.
+        match_files (List[str]): Names of the CSV files with metadata or player data.
+        type (str): "match" for match metadata, otherwise player data.
 
     Returns:
         pd.DataFrame: A DataFrame containing processed metadata or player data.
     """
     # Need to manually assign colnames to allow pandas to read in data
     colnames = ["info", "key", "value", "player", "hash"]
-    all_matches = pd.concat(
-        [
-            pd.read_csv(f, names=colnames, skiprows=1).assign(match_id=f)
-            for f in match_filepaths
-        ],
-        ignore_index=True,
-    )
-    all_matches["match_id"] = all_matches["match_id"].str.extract(
-        r"([a-zA-Z0-9_\-\.]*$)"
-    )
-    all_matches["match_id"] = all_matches["match_id"].str.replace("_info.csv", "")
+
+    def read_match(f, name):
+        # Match ID is the file name without its _info suffix
+        match_id = Path(name).stem.removesuffix("_info")
+        return pd.read_csv(f, names=colnames, skiprows=1).assign(match_id=match_id)
+
+    dataframes = read_zip_members(zip_path, match_files, read_match)
+    all_matches = pd.concat(dataframes, ignore_index=True)
 
     if type == "match":
         all_matches = process_match_metadata(all_matches)
@@ -143,6 +218,24 @@ def process_metadata(match_filepaths: List[str]) -> pd.DataFrame:
     return all_matches
 
 
+# %%
+def _segment_cumsum(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Cumulative sums of `values` that restart wherever `starts` is True.
+
+    Args:
+        values (np.ndarray): The values to sum.
+        starts (np.ndarray): Boolean array marking the first element of each
+            segment. The first element must be True.
+
+    Returns:
+        np.ndarray: The running total of each element within its segment.
+    """
+    total = np.cumsum(values)
+    # Take off the running total reached before each segment started
+    before = (total - values)[starts]
+    return (total - before[np.cumsum(starts) - 1]).astype(values.dtype)
+
+
 # %%
 def cleaning_bbb_t20_cricsheet(df: pd.DataFrame) -> pd.DataFrame:
     """Cleans and processes ball-by-ball T20 cricket data from Cricsheet.
@@ -162,51 +255,86 @@ def cleaning_bbb_t20_cricsheet(df: pd.DataFrame) -> pd.DataFrame:
             for cumulative metrics, adjusted ball counts, innings totals, and
             target scores, reordered for ease of use.
     """
-    df["wicket"] = ~df["wicket_type"].isin(["retired hurt"]) & df["wicket_type"].notna()
-
-    df["over"] = np.ceil(df["ball"]).astype(int)
+    # Step 1: Compact dtypes - group by integer match codes rather than match
+    # ID strings, store repeated labels as categories and counters as int8/int16
+    match_key = pd.Series(
+        pd.factorize(df["match_id"])[0], index=df.index, name="match_code"
+    )
+    df["innings"] = df["innings"].astype(np.int8)
+    for col in ["venue", "batting_team", "bowling_team", "wicket_type"]:
+        df[col] = df[col].astype("category")
+
+    # Wickets are any dismissal but retired hurt - compared as category codes
+    wicket_codes = df["wicket_type"].cat.codes.to_numpy()
+    retired_hurt = df["wicket_type"].cat.categories.get_indexer(["retired hurt"])[0]
+    df["wicket"] = (wicket_codes != -1) & (wicket_codes != retired_hurt)
+
+    # Over is the ball number rounded up, e.g. 0.1-0.6 -> 1
+    ball = df["ball"].to_numpy()
+    whole_overs = ball.astype(np.int8)
+    df["over"] = whole_overs + (ball > whole_overs).astype(np.int8)
     df["extra_ball"] = df["wides"].notna() | df["noballs"].notna()
 
-    # Step 2: Adjust ball values within each over
-    df["ball"] = df.groupby(["match_id", "innings", "over"]).cumcount() + 1
-
-    # Step 3: Calculate cumulative runs and wickets
-    df["runs_scored_yet"] = (
-        df.groupby(["match_id", "innings"])["runs_off_bat"].cumsum()
-        + df.groupby(["match_id", "innings"])["extras"].cumsum()
+    # Step 2: Order balls by match, innings and over - the sort is stable, so
+    # balls keep their delivery order - and mark where each innings and over starts
+    match_codes = match_key.to_numpy()
+    innings = df["innings"].to_numpy()
+    over = df["over"].to_numpy()
+    order = np.lexsort((over, innings, match_codes))
+    match_codes, innings, over = match_codes[order], innings[order], over[order]
+    new_innings = np.empty(len(df), dtype=bool)
+    new_innings[:1] = True
+    new_innings[1:] = (match_codes[1:] != match_codes[:-1]) | (
+        innings[1:] != innings[:-1]
     )
-
-    df["wickets_lost_yet"] = df.groupby(["match_id", "innings"])["wicket"].cumsum()
-
-    # Step 4: Calculate balls in over and balls remaining
-    df["extra_ball"] = df.groupby(["match_id", "innings", "over"])[
-        "extra_ball"
-    ].cumsum()
+    new_over = new_innings.copy()
+    new_over[1:] |= over[1:] != over[:-1]
+
+    def unsort(values):
+        # Put values computed in sorted order back in the original row order
+        unsorted = np.empty_like(values)
+        unsorted[order] = values
+        return unsorted
+
+    # Step 3: Adjust ball values and count extra balls within each over
+    ball = _segment_cumsum(np.ones(len(df), dtype=np.int8), new_over)
+    extra_ball = _segment_cumsum(df["extra_ball"].to_numpy(np.int8)[order], new_over)
+    df["ball"] = unsort(ball)
+    df["extra_ball"] = unsort(extra_ball)
+
+    # Step 4: Calculate cumulative runs and wickets within each innings
+    runs = df["runs_off_bat"].to_numpy()[order] + df["extras"].to_numpy()[order]
+    runs_scored_yet = _segment_cumsum(runs, new_innings)
+    wickets = df["wicket"].to_numpy(np.int8)[order]
+    df["runs_scored_yet"] = unsort(runs_scored_yet)
+    df["wickets_lost_yet"] = unsort(_segment_cumsum(wickets, new_innings))
+
+    # Step 5: Calculate balls in over and balls remaining
     df["ball_in_over"] = df["ball"] - df["extra_ball"]
-    df["balls_remaining"] = np.where(
-        df["innings"].isin([1, 2]),
-        120 - ((df["over"] - 1) * 6 + df["ball_in_over"]),
-        6 - df["ball_in_over"],
-    )  # For tie breaker, each team plays 1 over (6 balls, innings 3 & 4)
-
-    # Step 5: Calculate innings totals
-    innings_total = (
-        df.groupby(["match_id", "innings"])["runs_off_bat"].sum()
-        + df.groupby(["match_id", "innings"])["extras"].sum()
-    ).reset_index(name="total_score")
-
-    innings_total = (
-        innings_total.pivot(index="match_id", columns="innings", values="total_score")
-        .rename(columns={1: "innings1_total", 2: "innings2_total"})
-        .filter(["innings1_total", "innings2_total"])
-        .reset_index()
+    ball_in_over = df["ball_in_over"].to_numpy()
+    balls_remaining = 120 - ((df["over"].to_numpy(np.int16) - 1) * 6 + ball_in_over)
+    # For tie breaker, each team plays 1 over (6 balls, innings 3 & 4)
+    tie_breaker = df["innings"].to_numpy() > 2
+    np.subtract(6, ball_in_over, out=balls_remaining, where=tie_breaker)
+    df["balls_remaining"] = balls_remaining
+
+    # Step 6: Calculate innings totals - the running score on the last ball
+    innings_id = np.cumsum(new_innings) - 1
+    innings_end = np.r_[np.flatnonzero(new_innings)[1:], len(df)] - 1
+    innings_score = pd.Series(
+        unsort(runs_scored_yet[innings_end][innings_id]), index=df.index
     )
 
-    # Step 6: Merge all data
-    df = df.merge(innings_total, on="match_id", how="inner")
+    # Step 7: Broadcast first and second innings totals to every ball of the match
+    for innings in [1, 2]:
+        df[f"innings{innings}_total"] = (
+            innings_score.where(df["innings"] == innings)
+            .groupby(match_key, sort=False)
+            .transform("max")
+        )
     df["target"] = df["innings1_total"] + 1
 
-    # Step 7: Reorder columns
+    # Step 8: Reorder columns
     column_order = [
         "match_id",
         "season",
@@ -241,10 +369,249 @@ def cleaning_bbb_t20_cricsheet(df: pd.DataFrame) -> pd.DataFrame:
         "other_wicket_type",
         "other_player_dismissed",
     ]
-    df = df[column_order + [col for col in df.columns if col not in column_order]]
+    known = set(column_order)
+    column_order += [col for col in df.columns if col not in known]
+    df = df.reindex(columns=column_order)
     return df
 
 
+# %%
+def _content_range_total(response: requests.Response) -> Optional[int]:
+    """Returns the full file size of a partial (206) response.
+
+    Returns None if the response is not partial or its Content-Range gives no
+    numeric total (e.g. `bytes 0-1048575/*`).
+    """
+    if response.status_code != 206:
+        return None
+    content_range = response.headers.get("Content-Range", "")
+    total = content_range.rpartition("/")[2]
+    return int(total) if total.isdigit() else None
+
+
+def _stream_to_file(
+    response: requests.Response, path: str, mode: str, offset: int = 0
+) -> int:
+    """Writes a streamed response body to a file, returning the bytes written."""
+    written = 0
+    with response, open(path, mode) as f:
+        f.seek(offset)
+        for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+            written += f.write(chunk)
+    return written
+
+
+def _raise_for_error(response: requests.Response) -> None:
+    """Closes a streamed response and raises if it is an HTTP error."""
+    if not response.ok:
+        # Release the connection before raising
+        response.close()
+        response.raise_for_status()
+
+
+def _get_whole_file(url: str) -> requests.Response:
+    """Starts a plain streamed download of a whole file, raising on HTTP errors."""
+    response = SESSION.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT)
+    _raise_for_error(response)
+    return response
+
+
+def _download_ranges(
+    url: str, path: str, start: int, total_size: int, etag: Optional[str]
+) -> None:
+    """Downloads bytes `start` to `total_size` of a file in parallel ranges.
+
+    Args:
+        url (str): The URL of the file.
+        path (str): The partially downloaded file to complete in place.
+        start (int): The number of bytes already in `path`.
+        total_size (int): The full size of the file.
+        etag (Optional[str]): The file's strong ETag, sent as `If-Range` so
+            every range comes from the same version of the file.
+
+    Raises:
+        requests.exceptions.RequestException: If a range fails or the server
+            answers with anything other than the requested bytes.
+    """
+    with open(path, "r+b") as f:
+        f.truncate(total_size)
+    part_size = -(-(total_size - start) // DOWNLOAD_PARTS)
+    ranges = [
+        (lo, min(lo + part_size, total_size) - 1)
+        for lo in range(start, total_size, part_size)
+    ]
+
+    def fetch_range(lo, hi):
+        headers = {"Range": f"bytes={lo}-{hi}"}
+        if etag is not None:
+            headers["If-Range"] = etag
+        response = SESSION.get(
+            url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT
+        )
+        if response.status_code != 206:
+            _raise_for_error(response)
+            response.close()
+            raise requests.exceptions.RequestException(
+                f"Range request for {url} was not honoured"
+            )
+        if _stream_to_file(response, path, "r+b", lo) != hi - lo + 1:
+            raise requests.exceptions.RequestException(
+                f"Incomplete range {lo}-{hi} downloaded from {url}"
+            )
+
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_PARTS) as executor:
+        futures = [executor.submit(fetch_range, lo, hi) for lo, hi in ranges]
+        for future in futures:
+            future.result()
+
+
+# %%
+def download_cricsheet_zip(urls: List[str], destfile_path: str) -> None:
+    """Downloads a Cricsheet zip file, revalidating any cached copy.
+
+    Each URL is tried in turn. If a copy of the zip already exists, its stored
+    ETag and Last-Modified date are sent as `If-None-Match` and
+    `If-Modified-Since` so an unchanged file is not downloaded again. The
+    cached copy is also kept when Cricsheet cannot be reached, does not answer
+    within `DOWNLOAD_TIMEOUT`, or the download breaks off. New downloads
+    are streamed to disk rather than held in memory, using `DOWNLOAD_PARTS`
+    parallel byte-range requests when the server supports them.
+
+    Args:
+        urls (List[str]): Candidate download URLs, tried in order.
+        destfile_path (str): The path the zip file is saved to. Its ETag and
+            Last-Modified date are stored alongside in `destfile_path + ".etag"`
+            and `destfile_path + ".lastmod"`.
+
+    Raises:
+        requests.exceptions.RequestException: If every URL fails and there is
+            no cached copy to fall back on.
+    """
+    validators = [
+        ("ETag", "If-None-Match", destfile_path + ".etag"),
+        ("Last-Modified", "If-Modified-Since", destfile_path + ".lastmod"),
+    ]
+    cached = os.path.exists(destfile_path)
+    headers = {}
+    if cached:
+        for _, request_header, path in validators:
+            if os.path.exists(path):
+                with open(path) as f:
+                    headers[request_header] = f.read().strip()
+
+    for url in urls:
+        try:
+            # Ask for the first chunk only - if the server supports ranges the
+            # rest is fetched in parallel below
+            response = SESSION.get(
+                url,
+                headers={**headers, "Range": f"bytes=0-{DOWNLOAD_CHUNK_SIZE - 1}"},
+                stream=True,
+                timeout=DOWNLOAD_TIMEOUT,
+            )
+            # Cached copy is still current
+            if response.status_code == 304:
+                response.close()
+                return
+            _raise_for_error(response)
+            break
+        except requests.exceptions.RequestException as e:
+            error = e
+    else:
+        if cached:
+            return
+        raise error
+
+    # Stream to a partial file so an interrupted download never replaces the
+    # cached copy
+    part_path = destfile_path + ".part"
+    try:
+        ranged = response.status_code == 206
+        total_size = _content_range_total(response)
+        etag = response.headers.get("ETag")
+        if ranged and (total_size is None or (etag or "").startswith("W/")):
+            # The rest can't be requested without the file size, or safely
+            # pinned to this version with a weak ETag (If-Range needs a strong
+            # one) - start again with a single download of the whole file
+            response.close()
+            response = _get_whole_file(url)
+            ranged = False
+        _stream_to_file(response, part_path, "wb")
+        if ranged and os.path.getsize(part_path) < total_size:
+            try:
+                _download_ranges(
+                    url,
+                    part_path,
+                    os.path.getsize(part_path),
+                    total_size,
+                    etag,
+                )
+            except requests.exceptions.RequestException:
+                # Fall back to a single download of the whole file
+                response = _get_whole_file(url)
+                _stream_to_file(response, part_path, "wb")
+        os.replace(part_path, destfile_path)
+    except BaseException as e:
+        # Never leave a partial download behind
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        # Keep the cached copy if the download broke off or stalled
+        if cached and isinstance(e, requests.exceptions.RequestException):
+            return
+        raise
+
+    # Store validators for the next call, dropping any the server no longer sends
+    for response_header, _, path in validators:
+        if response_header in response.headers:
+            with open(path, "w") as f:
+                f.write(response.headers[response_header])
+        elif os.path.exists(path):
+            os.remove(path)
+
+
+# %%
+def read_cricsheet_zip(zip_path: str, type: str) -> pd.DataFrame:
+    """Reads ball-by-ball, match or player data from a Cricsheet zip file.
+
+    Args:
+        zip_path (str): Path to the Cricsheet csv2 zip file.
+        type (str): "bbb" for ball-by-ball data, "match" for match metadata or
+            "player" for player data.
+
+    Returns:
+        pd.DataFrame: The combined data, before any cleaning.
+    """
+    # Get file list from zip
+    with zipfile.ZipFile(zip_path, "r") as z:
+        file_list = z.namelist()
+
+    # Categorize files
+    file_types = {
+        "txt": [f for f in file_list if "txt" in f],
+        "info": [f for f in file_list if "_info" in f],
+        "allbbb": [f for f in file_list if "all_matches" in f],
+        "bbb": [
+            f
+            for f in file_list
+            if "txt" not in f and "_info" not in f and "all_matches" not in f
+        ],
+    }
+
+    # Determine required files
+    if type == "bbb":
+        if "all_matches.csv" in file_types["allbbb"]:
+            match_files = ["all_matches.csv"]
+        else:
+            match_files = file_types["bbb"]
+    else:
+        match_files = file_types["info"]
+
+    # Read data from CSVs straight out of the zip
+    if type == "bbb":
+        return process_bbb_data(zip_path, match_files)
+    return process_metadata(zip_path, match_files, type)
+
+
 # %%
 def fetch_cricsheet(type="bbb", gender="male", competition="tests"):
     """
@@ -276,7 +643,12 @@ def fetch_cricsheet(type="bbb", gender="male", competition="tests"):
     Notes:
         - The function handles backwards compatibility for the `competition` parameter using a `competition_map`.
         - If the `type` is "bbb" and the competition contains ball-by-ball data, the function will clean the data specifically for T20 matches.
-        - The function utilizes temporary directories for downloading and extracting files.
+        - The function downloads to a temporary directory and reads the CSV files
+          straight from the zip without extracting them. A previously downloaded zip
+          is revalidated with its ETag and only re-downloaded when Cricsheet has a
+          newer copy. The data read from each copy of the zip is cached as a pickle
+          in a private per-user directory (`~/.cache/cricketpy`), so repeat calls
+          skip reading the CSVs.
         - The cleaned data is returned as a pandas DataFrame after processing and cleaning.
 
     """
@@ -310,68 +682,46 @@ def fetch_cricsheet(type="bbb", gender="male", competition="tests"):
     url = f"https://cricsheet.org/downloads/{destfile}"
 
     # Temporary directory
-    subdir = f"{destfile.replace('_csv2.zip', '')}_bbb"
     temp_dir = tempfile.gettempdir()
     destfile_path = os.path.join(temp_dir, destfile)
 
-    # Headers
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"
-    }
-
-    # Download the file if not already downloaded
-    if not os.path.exists(destfile_path):
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-        except:
-            response = requests.get(
-                f"https://cricsheet.org/downloads/{competition}s_{gender}_csv2.zip",
-                headers=headers,
-            )
-        response.raise_for_status()
-        with open(destfile_path, "wb") as f:
-            f.write(response.content)
-
-    # Extract files in zip and get file list
-    with zipfile.ZipFile(destfile_path, "r") as z:
-        file_list = z.namelist()
-
-    # Categorize files
-    file_types = {
-        "txt": [f for f in file_list if "txt" in f],
-        "info": [f for f in file_list if "_info" in f],
-        "allbbb": [f for f in file_list if "all_matches" in f],
-        "bbb": [
-            f
-            for f in file_list
-            if "txt" not in f and "_info" not in f and "all_matches" not in f
-        ],
-    }
-
-    # Determine required files
-    if type == "bbb":
-        if "all_matches.csv" in file_types["allbbb"]:
-            match_files = "all_matches.csv"
-        else:
-            match_files = file_types["bbb"]
-    else:
-        match_files = file_types["info"]
-
-    # Extract files into a subdirectory
-    output_dir = os.path.join(temp_dir, subdir)
-    os.makedirs(output_dir, exist_ok=True)
-    with zipfile.ZipFile(destfile_path, "r") as z:
-        z.extractall(output_dir, members=match_files)
-
-    # Load and process files
-    match_filepaths = [os.path.join(output_dir, f) for f in match_files]
+    # Download the file, or revalidate the copy from a previous call
+    download_cricsheet_zip(
+        [url, f"https://cricsheet.org/downloads/{competition}s_{gender}_csv2.zip"],
+        destfile_path,
+    )
 
-    # Read data from CSVs stored in temp directory
-    if type == "bbb":
-        all_matches = process_bbb_data(match_filepaths)
-    else:
-        all_matches = process_metadata(match_filepaths)
+    # Read the zip, or reuse what a previous call read from this same copy of it
+    zip_stat = os.stat(destfile_path)
+    cache_dir = private_cache_dir()
+    cache_prefix = f"{competition}_{gender}_{type}_"
+    cache_name = (
+        f"{cache_prefix}v{CACHE_VERSION}_pandas{pd.__version__}_"
+        f"{zip_stat.st_mtime_ns}_{zip_stat.st_size}.pkl"
+    )
+    all_matches = None
+    if cache_dir is not None:
+        cache_path = os.path.join(cache_dir, cache_name)
+        if os.path.exists(cache_path):
+            try:
+                all_matches = pd.read_pickle(cache_path)
+            except Exception:
+                # Unreadable cache - read the zip again and rewrite it below
+                all_matches = None
+
+    if all_matches is None:
+        all_matches = read_cricsheet_zip(destfile_path, type)
+        # Without a private directory to cache in, the zip is read every time
+        if cache_dir is not None:
+            # Replace any cache of an older copy of the zip, cache version or
+            # pandas version
+            for old_cache in Path(cache_dir).glob(f"{cache_prefix}*.pkl"):
+                try:
+                    old_cache.unlink()
+                except OSError:
+                    pass
+            all_matches.to_pickle(cache_path + ".part")
+            os.replace(cache_path + ".part", cache_path)
 
     # Clean data
     if type == "bbb" and "ball" in all_matches.columns:
@@ -1,33 +1,95 @@
+import os
 import pandas as pd
 import numpy as np
+from typing import Optional
+
+# Largest ratio of distinct values to rows for a column stored as category
+CATEGORY_MAX_RATIO = 0.5
+
+# Leading values parsed before trying to parse a whole column as numbers
+NUMERIC_SAMPLE_SIZE = 64
+
+
+def _is_string_column(s: pd.Series) -> bool:
+    """Whether a column has a string or object dtype."""
+    return s.dtype == object or isinstance(s.dtype, pd.StringDtype)
+
+
+def _to_numeric(s: pd.Series) -> pd.Series:
+    """Parses a column as numbers, returning it unchanged if any value is not a number."""
+    # Already numeric - nothing to parse
+    if pd.api.types.is_numeric_dtype(s):
+        return s
+    # Parsing stops at the first value that is not a number - a failing sample
+    # rules out text columns before the whole column is converted for parsing
+    try:
+        pd.to_numeric(s.iloc[:NUMERIC_SAMPLE_SIZE])
+        return pd.to_numeric(s)
+    except (ValueError, TypeError):
+        return s
+
+
+def _string_to_float(s: pd.Series) -> pd.Series:
+    """Strips a string column, treats empty strings as NaN and parses it as numbers."""
+    # Skip object columns holding other values, e.g. parsed dates
+    if pd.api.types.infer_dtype(s, skipna=True) not in ["string", "empty"]:
+        return s
+    return _to_numeric(s.str.strip().replace("", np.nan))
+
+
+def _float_to_int(s: pd.Series) -> pd.Series:
+    """Converts a whole-number float column to the smallest signed integer type.
+
+    Only float columns are narrowed - integer columns keep their dtype.
+    """
+    values = s.to_numpy()
+    # Whole numbers only - NaN and infinity fail both checks
+    if np.isfinite(values).all() and (values == np.trunc(values)).all():
+        values = pd.to_numeric(values.astype(np.int64), downcast="integer")
+        return pd.Series(values, index=s.index, name=s.name)
+    return s
+
+
+def _date_to_date(s: pd.Series) -> pd.Series:
+    """Parses a column as ISO 8601 dates unless it is already datetime."""
+    # Already parsed, e.g. by the pyarrow CSV engine
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s
+    return pd.to_datetime(s, format="ISO8601")
+
+
+def _category_compress(s: pd.Series, max_ratio: float) -> pd.Series:
+    """Converts a column to category if it has few enough distinct values."""
+    n_unique = s.nunique(dropna=True)
+    if 0 < n_unique < max_ratio * len(s):
+        return s.astype("category")
+    return s
 
 
 def col_string_to_float(df: pd.DataFrame, col: str) -> pd.Series:
     """
-    Converts a specified column in a DataFrame to float.
+    Converts a specified column in a DataFrame to a numeric type.
 
     Parameters:
     ----------
     df : pd.DataFrame
         The DataFrame containing the column to convert.
     col : str
-        The name of the column to convert to float.
+        The name of the column to convert.
 
     Returns:
     -------
     pd.Series
-        The column converted to float if possible. If conversion fails, the original column is returned.
+        The column converted to a numeric type if possible. If conversion fails, the original column is returned.
     """
-    try:
-        new_col = df[col].astype(float)
-        return new_col
-    except ValueError:
-        return df[col]
+    return _to_numeric(df[col])
 
 
 def string_to_float(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Converts all string or object-type columns in a DataFrame to floats, handling empty strings as NaN.
+    Converts all string or object-type columns in a DataFrame to a numeric type, handling empty strings as NaN.
+
+    Columns of whole numbers with no missing values parse as int64, others as float64.
 
     Parameters:
     ----------
@@ -37,18 +99,21 @@ def string_to_float(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
     -------
     pd.DataFrame
-        The DataFrame with applicable columns converted to float.
+        The DataFrame with applicable columns converted to int64 or float64.
     """
     for col in df.select_dtypes(include=["string", "object"]).columns:
-        df[col] = df[col].str.strip().replace("", np.nan)
-        df[col] = col_string_to_float(df, col)
-        return df
+        df[col] = _string_to_float(df[col])
+    return df
 
 
 def float_to_int(df: pd.DataFrame) -> pd.DataFrame:
     """
     Converts all float columns in a DataFrame to integers if all values in the column are whole numbers.
 
+    Each converted column uses the smallest signed integer type that holds its values.
+    Only float columns are narrowed - columns that are already integers, including
+    int64 columns parsed by `string_to_float` or the CSV reader, keep their dtype.
+
     Parameters:
     ----------
     df : pd.DataFrame
@@ -57,11 +122,10 @@ def float_to_int(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
     -------
     pd.DataFrame
-        The DataFrame with applicable float columns converted to int.
+        The DataFrame with applicable float columns converted to int8, int16, int32 or int64.
     """
     for col in df.select_dtypes(include=["float"]).columns:
-        if df[col].apply(float.is_integer).all():
-            df[col] = df[col].astype(int)
+        df[col] = _float_to_int(df[col])
     return df
 
 
@@ -69,6 +133,9 @@ def date_to_date(df: pd.DataFrame) -> pd.DataFrame:
     """
     Converts all columns in a DataFrame with 'date' in their names to datetime format.
 
+    Dates are parsed as ISO 8601 (e.g. 2024-06-01), the format Cricsheet uses.
+    Columns that are already datetime are left as they are.
+
     Parameters:
     ----------
     df : pd.DataFrame
@@ -79,8 +146,31 @@ def date_to_date(df: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         The DataFrame with applicable columns converted to datetime.
     """
-    for col in df.filter(like="date").columns:
-        df[col] = pd.to_datetime(df[col])
+    for col in [col for col in df.columns if "date" in str(col)]:
+        df[col] = _date_to_date(df[col])
+    return df
+
+
+def category_compress(
+    df: pd.DataFrame, max_ratio: float = CATEGORY_MAX_RATIO
+) -> pd.DataFrame:
+    """
+    Converts string or object-type columns with many repeated values to category dtype.
+
+    Parameters:
+    ----------
+    df : pd.DataFrame
+        The DataFrame with columns to convert.
+    max_ratio : float, default 0.5
+        The largest ratio of distinct values to rows for which a column is converted.
+
+    Returns:
+    -------
+    pd.DataFrame
+        The DataFrame with applicable columns converted to category.
+    """
+    for col in df.select_dtypes(include=["string", "object"]).columns:
+        df[col] = _category_compress(df[col], max_ratio)
     return df
 
 
@@ -88,10 +178,13 @@ def dtype_clean(df: pd.DataFrame) -> pd.DataFrame:
     """
     Cleans and optimizes the data types in a DataFrame.
 
-    This function performs a series of type conversions on the input DataFrame:
-    1. Converts string or object-type columns to float where possible.
-    2. Converts float columns to integer if all values in the column are whole numbers.
+    This function performs a series of type conversions on each column of the
+    input DataFrame, in a single pass over the columns:
+    1. Converts string or object-type columns to a numeric type where possible.
+    2. Converts float columns to the smallest integer type if all values in the
+       column are whole numbers. Integer columns keep their dtype.
     3. Converts columns with 'date' in their names to datetime format.
+    4. Converts string columns with many repeated values to category.
 
     Parameters:
     ----------
@@ -103,10 +196,50 @@ def dtype_clean(df: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         The DataFrame with cleaned and optimized data types.
     """
-    # String to float
-    df = string_to_float(df)
-    # Float to int
-    df = float_to_int(df)
-    # Date to date
-    df = date_to_date(df)
+    for col in df.columns:
+        s = original = df[col]
+        # String to float
+        if _is_string_column(s):
+            s = _string_to_float(s)
+        # Float to int
+        if pd.api.types.is_float_dtype(s):
+            s = _float_to_int(s)
+        # Date to date
+        if "date" in str(col):
+            s = _date_to_date(s)
+        # Repeated strings to category
+        if _is_string_column(s):
+            s = _category_compress(s, CATEGORY_MAX_RATIO)
+        # Only write back columns that were converted
+        if s is not original:
+            df[col] = s
     return df
+
+
+def private_cache_dir() -> Optional[str]:
+    """
+    Returns this user's private cache directory, or None if it is not private.
+
+    The directory lives under the user's cache home (`$XDG_CACHE_HOME` or
+    `~/.cache`) rather than the shared temporary directory, and is only used
+    when it is owned by the current user with mode 0700, since the caches
+    stored there are unpickled back into the process.
+
+    Returns:
+    -------
+    Optional[str]
+        The path of the cache directory, or None if it can't be made private.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    path = os.path.join(base, "cricketpy")
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        if hasattr(os, "getuid"):
+            if os.stat(path).st_uid != os.getuid():
+                return None
+            os.chmod(path, 0o700)
+    except OSError:
+        return None
+    return path